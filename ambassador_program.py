@@ -31,6 +31,9 @@ load_dotenv()
 # Import Google Docs integration
 from google_docs_integration import GoogleDocsManager, AmbassadorReportingSystem, AmbassadorDocsConfig
 
+# Matches submission links in ambassador messages (only the first one is used)
+URL_RE = re.compile(r'https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?')
+
 class PostType(Enum):
     # Instagram
     IG_REEL = "ig_reel"
@@ -125,6 +128,32 @@ class Platform(Enum):
     LEMON8 = "lemon8"
     UNKNOWN = "unknown"
 
+# URL substring -> (platform, post type), checked in order by _detect_platform_from_url.
+# Enum members are resolved once here instead of on every call.
+_GENERIC_POST = (Platform.INSTAGRAM, PostType.IG_POST)
+_DOMAIN_MAP = (
+    (('youtube.com', 'youtu.be'), (Platform.YOUTUBE, PostType.YOUTUBE_VIDEO)),
+    (('tiktok.com',), (Platform.TIKTOK, PostType.TIKTOK_VIDEO)),
+    (('instagram.com',), (Platform.INSTAGRAM, PostType.IG_POST)),
+    (('facebook.com', 'fb.com'), (Platform.FACEBOOK, PostType.FB_GROUP_POST)),
+    (('twitter.com', 'x.com'), (Platform.TWITTER, PostType.TWITTER_POST)),
+    (('reddit.com',), (Platform.REDDIT, PostType.REDDIT_ANSWER)),
+    (('quora.com',), (Platform.QUORA, PostType.QUORA_ANSWER)),
+    (('linkedin.com',), _GENERIC_POST),
+    (('pinterest.com', 'pin.it'), _GENERIC_POST),
+    (('snapchat.com',), _GENERIC_POST),
+    (('discord.com', 'discord.gg'), _GENERIC_POST),
+    (('telegram.org', 't.me'), _GENERIC_POST),
+    (('whatsapp.com',), _GENERIC_POST),
+    (('tumblr.com',), _GENERIC_POST),
+    (('twitch.tv',), _GENERIC_POST),
+    (('vimeo.com',), _GENERIC_POST),
+    (('medium.com',), _GENERIC_POST),
+    (('substack.com',), _GENERIC_POST),
+    (('github.com', 'gitlab.com'), _GENERIC_POST),
+)
+_INSTAGRAM_REEL = (Platform.INSTAGRAM, PostType.IG_REEL)  # instagram.com URLs containing /reel/
+
 @dataclass
 class EngagementMetrics:
     likes: int = 0
@@ -925,36 +954,62 @@ class AmbassadorProgram:
             
             recovered_submissions = 0
             
+            # Per-channel cursor so repeated recoveries only walk new messages
+            with sqlite3.connect('ambassador_program.db') as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS scan_cursor (
+                        channel_id INTEGER PRIMARY KEY,
+                        last_message_id INTEGER
+                    )
+                ''')
+                
+                # Load active ambassadors once instead of querying per message
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM ambassadors WHERE status = "active"')
+                # Keyed by int discord_id; the column is TEXT, so skip blank/non-numeric IDs (no author can match them)
+                active_ambassadors = {
+                    int(row[1]): row for row in cursor.fetchall()
+                    if row[1] is not None and str(row[1]).strip().isdigit()
+                }
+            
             # Scan recent messages in ambassador channels
             for channel in ambassador_channels:
                 try:
-                    # Look back 30 days
-                    after_date = datetime.now() - timedelta(days=30)
+                    with sqlite3.connect('ambassador_program.db') as conn:
+                        cursor = conn.cursor()
+                        cursor.execute('SELECT last_message_id FROM scan_cursor WHERE channel_id = ?', (channel.id,))
+                        last_scanned = cursor.fetchone()
                     
-                    async for message in channel.history(limit=1000, after=after_date):
-                        # Skip bot messages
-                        if message.author.bot:
-                            continue
-                        
-                        # Check if user is an ambassador
-                        with sqlite3.connect('ambassador_program.db') as conn:
-                            cursor = conn.cursor()
-                            cursor.execute('SELECT * FROM ambassadors WHERE discord_id = ? AND status = "active"', 
-                                         (str(message.author.id),))
-                            ambassador = cursor.fetchone()
-                        
-                        if not ambassador:
-                            continue
+                    if last_scanned:
+                        # Resume right after the last message we already scanned
+                        after = discord.Object(id=last_scanned[0])
+                        max_id = last_scanned[0]
+                    else:
+                        # First scan - look back 30 days
+                        after = datetime.now() - timedelta(days=30)
+                        max_id = 0
+                    
+                    messages = [message async for message in channel.history(limit=1000, after=after)]
+                    if messages:
+                        max_id = max(max_id, max(message.id for message in messages))
+                    
+                    # Narrow down in tight passes before the regex/hashing stage:
+                    # human messages with a link or attachment, from active ambassadors
+                    candidates = [m for m in messages if not m.author.bot]
+                    candidates = [m for m in candidates if m.attachments or 'http' in m.content]
+                    candidates = [m for m in candidates if m.author.id in active_ambassadors]
+                    
+                    for message in candidates:
+                        ambassador = active_ambassadors[message.author.id]
                         
-                        # Check for URLs or attachments
-                        import re
-                        url_pattern = r'https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?'
-                        urls = re.findall(url_pattern, message.content)
+                        # Check for URLs or attachments (only the first URL is used)
+                        url_match = URL_RE.search(message.content) if 'http' in message.content else None
+                        first_url = url_match.group(0) if url_match else None
                         screenshots = [att for att in message.attachments if att.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))]
                         
-                        if urls or screenshots:
+                        if first_url or screenshots:
                             # Check if already processed
-                            content_hash = self.generate_content_hash(message.content, urls[0] if urls else None)
+                            content_hash = self.generate_content_hash(message.content, first_url)
                             
                             with sqlite3.connect('ambassador_program.db') as conn:
                                 cursor = conn.cursor()
@@ -964,14 +1019,18 @@ class AmbassadorProgram:
                                     continue  # Already processed
                             
                             # Process the submission
-                            if urls:
-                                await self._recover_url_submission(message, ambassador, urls[0])
+                            if first_url:
+                                await self._recover_url_submission(message, ambassador, first_url)
                             elif screenshots:
                                 await self._recover_screenshot_submission(message, ambassador, screenshots[0])
                             
                             # New function call
                             await self.handle_submission(message, ambassador)
                             recovered_submissions += 1
+                    
+                    if max_id:
+                        with sqlite3.connect('ambassador_program.db') as conn:
+                            conn.execute('INSERT OR REPLACE INTO scan_cursor VALUES (?, ?)', (channel.id, max_id))
                 
                 except Exception as e:
                     print(f"❌ Error recovering from channel {channel.name}: {e}")
@@ -986,47 +1045,12 @@ class AmbassadorProgram:
         """Detect platform and post type from URL"""
         url_lower = url.lower()
         
-        if 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-            return Platform.YOUTUBE, PostType.YOUTUBE_VIDEO
-        elif 'tiktok.com' in url_lower:
-            return Platform.TIKTOK, PostType.TIKTOK_VIDEO
-        elif 'instagram.com' in url_lower:
-            if '/reel/' in url_lower:
-                return Platform.INSTAGRAM, PostType.INSTAGRAM_REEL
-            else:
-                return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'facebook.com' in url_lower or 'fb.com' in url_lower:
-            return Platform.FACEBOOK, PostType.FB_GROUP_POST
-        elif 'twitter.com' in url_lower or 'x.com' in url_lower:
-            return Platform.TWITTER, PostType.TWEET
-        elif 'reddit.com' in url_lower:
-            return Platform.REDDIT, PostType.REDDIT_ANSWER
-        elif 'quora.com' in url_lower:
-            return Platform.QUORA, PostType.QUORA_ANSWER
-        elif 'linkedin.com' in url_lower:
-            return Platform.LINKEDIN, PostType.INSTAGRAM_POST
-        elif 'pinterest.com' in url_lower or 'pin.it' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'snapchat.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'discord.com' in url_lower or 'discord.gg' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'telegram.org' in url_lower or 't.me' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'whatsapp.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'tumblr.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'twitch.tv' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'vimeo.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'medium.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'substack.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        elif 'github.com' in url_lower or 'gitlab.com' in url_lower:
-            return Platform.INSTAGRAM, PostType.INSTAGRAM_POST
-        else:
-            # Unknown platform - accept but will be flagged for review
-            return None, None
+        for needles, detected in _DOMAIN_MAP:
+            for needle in needles:
+                if needle in url_lower:
+                    if needle == 'instagram.com' and '/reel/' in url_lower:
+                        return _INSTAGRAM_REEL
+                    return detected
+        
+        # Unknown platform - accept but will be flagged for review
+        return None, None
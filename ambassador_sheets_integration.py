@@ -6,14 +6,229 @@ Integrates with Jim's ambassador system to sync ambassador data to a Google Spre
 import os
 import json
 import logging
+from collections import Counter, deque
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import aiohttp
 import asyncio
-import jwt
+import base64
 import time
+import random
+import hashlib
+import tempfile
+from contextlib import asynccontextmanager
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Data ranges read back by the from-sheet syncs (skipping the header row)
+AMBASSADOR_SHEET_RANGE = "Ambassadors!A2:I"
+SUBMISSIONS_SHEET_RANGE = "Submissions!A2:L"
+
+# addSheet requests for the two synced sheets (static, so built once at import)
+_ADD_AMBASSADORS_SHEET = {
+    "addSheet": {
+        "properties": {
+            "title": "Ambassadors",
+            "gridProperties": {"rowCount": 1000, "columnCount": 10}
+        }
+    }
+}
+_ADD_SUBMISSIONS_SHEET = {
+    "addSheet": {
+        "properties": {
+            "title": "Submissions",
+            "gridProperties": {"rowCount": 5000, "columnCount": 12}
+        }
+    }
+}
+
+# Seconds a leaderboard read is reused for (it's a Discord display, not a ledger)
+LEADERBOARD_CACHE_TTL = 60
+
+# Transient Sheets/OAuth responses worth retrying (rate limit + server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Sheets write quota per user - shared by every manager in the process
+SHEETS_WRITES_PER_MINUTE = 60
+_write_times: deque = deque()
+_write_lock = asyncio.Lock()
+
+
+async def _wait_for_write_slot():
+    """Sliding-window limiter: wait until a write fits in the last 60 seconds' quota"""
+    async with _write_lock:
+        while True:
+            now = time.monotonic()
+            while _write_times and now - _write_times[0] >= 60:
+                _write_times.popleft()
+            if len(_write_times) < SHEETS_WRITES_PER_MINUTE:
+                _write_times.append(now)
+                return
+            await asyncio.sleep(60 - (now - _write_times[0]))
+
+
+class _AdaptiveLimiter:
+    """AIMD cap on concurrent Sheets requests: +1 while responses are fast, halved on slowdowns or 429/5xx"""
+    
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16,
+                 target_latency: float = 0.5, window: int = 32):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._latencies: deque = deque(maxlen=window)
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+    
+    async def release(self, latency: float, throttled: bool):
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._latencies.clear()
+            else:
+                self._latencies.append(latency)
+                if len(self._latencies) == self._latencies.maxlen:
+                    if sum(self._latencies) / len(self._latencies) <= self.target_latency:
+                        self.limit = min(self.maximum, self.limit + 1)
+                    else:
+                        self.limit = max(self.minimum, self.limit // 2)
+                    self._latencies.clear()
+            self._condition.notify_all()
+
+
+# Shared by every manager so concurrent syncs back off together
+_sheets_limiter = _AdaptiveLimiter()
+
+
+def _json_dumps(obj) -> str:
+    """Serialize request bodies - orjson when installed (much faster on large row lists)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_bytes(obj) -> bytes:
+    """Encode a large request body straight to bytes (skips the str round-trip of json_serialize)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+async def _read_json(response: aiohttp.ClientResponse):
+    """Parse a response body - orjson when installed (large values:get payloads)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(await response.read())
+    return await response.json()
+
+
+# For request bodies pre-encoded with _json_bytes
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _cell(value) -> dict:
+    """CellData for a value written as-is (like valueInputOption=RAW)"""
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    if value is None or value == "":
+        return {}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
+def _b64url(data: bytes) -> str:
+    """Unpadded base64url encoding used by JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+# JWT header is the same for every service account assertion
+_JWT_HEADER_SEGMENT = _b64url(b'{"alg":"RS256","typ":"JWT"}')
+
+
+@lru_cache(maxsize=None)
+def _load_service_account(credentials_path: str) -> Tuple[dict, object]:
+    """Parse the service account JSON and RSA key once per process, shared by every manager"""
+    # Try environment variable first, then file
+    credentials_json = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
+    if credentials_json:
+        credentials = json.loads(credentials_json)
+    else:
+        with open(credentials_path, 'r') as f:
+            credentials = json.load(f)
+    
+    private_key = load_pem_private_key(credentials['private_key'].encode(), password=None)
+    return credentials, private_key
+
+
+def _discord_id_text(value) -> str:
+    """Discord ID cell as text - unformatted reads return IDs stored as numbers as int/float"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _comparable_rows(rows: List[List]) -> List[List]:
+    """Ambassador rows normalized for comparison: padded to A:I, "Last Updated" dropped, None as blank"""
+    comparable = []
+    for row in rows:
+        row = [("" if value is None else value) for value in row]
+        row += [""] * (9 - len(row))  # Sheets drops trailing empty cells
+        row[0] = _discord_id_text(row[0])
+        comparable.append(row[:5] + row[6:])
+    return comparable
+
+
+def _is_already_exists(error_body) -> bool:
+    """Check a parsed Google API error for the duplicate-sheet case (addSheet on an existing title)"""
+    error = error_body.get('error', {}) if isinstance(error_body, dict) else {}
+    # addSheet reports INVALID_ARGUMENT with an "already exists" message rather than ALREADY_EXISTS
+    return error.get('status') == 'ALREADY_EXISTS' or 'already exists' in error.get('message', '')
+
+
+def _to_int(value, default: int = 0) -> int:
+    """Parse a sheet cell as an int (negatives included), falling back to default"""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def _dedupe_key(value) -> str:
+    """message_id / screenshot_hash as text for dedupe - '' when missing (never "None")"""
+    if value is None:
+        return ""
+    text = str(value)
+    return "" if text == "None" else text
+
 
 class AmbassadorSheetsManager:
+    # Sheet titles known to exist per spreadsheet, so create_*_sheet only hits the API once per process
+    _ensured_sheets: Dict[str, set] = {}
+    # Spreadsheets whose existing sheet titles have already been read this process
+    _titles_loaded: set = set()
+    # (sheetId, rowCount) per sheet title per spreadsheet, for grid-level batchUpdate requests
+    _sheet_grid_cache: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    # (message IDs, screenshot hashes) already in each Submissions sheet, for append dedupe
+    _dedupe_indexes: Dict[str, Tuple[set, set]] = {}
+    # Spreadsheets whose Submissions sheet has been read into _dedupe_indexes this process
+    _dedupe_loaded: set = set()
+    # (fetched_at, full sorted leaderboard) per spreadsheet
+    _leaderboard_cache: Dict[str, Tuple[float, List[dict]]] = {}
+    
     def __init__(self, spreadsheet_id: str, credentials_path: str, supabase_client):
         """
         Initialize Ambassador Sheets Manager
@@ -29,6 +244,22 @@ class AmbassadorSheetsManager:
         self.base_url = "https://sheets.googleapis.com/v4/spreadsheets"
         self.access_token = None
         self.token_expires = 0
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Spreadsheet-level requests waiting to go out in one batchUpdate (see flush_batch)
+        self._pending_requests: List[dict] = []
+        self._known_sheets = self._ensured_sheets.setdefault(spreadsheet_id, set())
+        self._sheet_grids = self._sheet_grid_cache.setdefault(spreadsheet_id, {})
+        
+        # Shared HTTP session (created lazily - no event loop yet at construction time)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Service account credentials and RSA signing key, parsed once per manager
+        self._credentials: Optional[dict] = None
+        self._private_key = None
+        self._load_credentials()
+        self._load_cached_token()
         
         # Ambassador sheet headers
         self.ambassador_headers = [
@@ -42,50 +273,165 @@ class AmbassadorSheetsManager:
             "Points Awarded", "Timestamp", "Status", "Screenshot Hash", "Message ID", "Notes"
         ]
         
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=128, limit_per_host=32, keepalive_timeout=75,
+                    use_dns_cache=True, ttl_dns_cache=300, enable_cleanup_closed=True
+                ),
+                # Fail fast on stuck handshakes; full-sheet writes get a bit more time overall
+                timeout=aiohttp.ClientTimeout(total=60, connect=5),
+                headers={"Authorization": f"Bearer {self.access_token}"} if self.access_token else None,
+                json_serialize=_json_dumps
+            )
+        return self._session
+    
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, max_retries: int = 5, auth: bool = True, **kwargs):
+        """Make an HTTP request, backing off and retrying on 429/5xx (honours Retry-After)"""
+        # Refreshes the session's Authorization header when the cached token is about to expire
+        if auth and not await self.get_access_token():
+            raise Exception("Failed to get access token")
+        if auth and method != 'GET':
+            await _wait_for_write_slot()
+        
+        session = await self._get_session()
+        for attempt in range(max_retries + 1):
+            await _sheets_limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await session.request(method, url, **kwargs)
+            except Exception:
+                await _sheets_limiter.release(time.monotonic() - started, throttled=True)
+                raise
+            await _sheets_limiter.release(time.monotonic() - started, throttled=response.status in RETRY_STATUSES)
+            
+            if response.status not in RETRY_STATUSES or attempt == max_retries:
+                break
+            
+            retry_after = response.headers.get('Retry-After')
+            response.release()
+            try:
+                delay = float(retry_after)
+                delay += random.uniform(0, 0.25 * delay)  # Jitter so concurrent retries don't line up
+            except (TypeError, ValueError):
+                delay = min(2 ** attempt, 32) + random.uniform(0, 1)
+            logging.warning(f"Google API returned {response.status}, retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+        
+        try:
+            yield response
+        finally:
+            response.release()
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _load_credentials(self):
+        """Load service account credentials and pre-parse the private key"""
+        try:
+            self._credentials, self._private_key = _load_service_account(self.credentials_path)
+        except FileNotFoundError:
+            return  # Reported when a token is first requested
+        except Exception as e:
+            logging.error(f"Failed to load Google service account credentials: {e}")
+    
+    def _token_cache_path(self) -> str:
+        """On-disk token cache, one file per service account"""
+        account = hashlib.sha256(self._credentials['client_email'].encode()).hexdigest()[:16]
+        return os.path.join(tempfile.gettempdir(), f"gsheets_token_{account}.json")
+    
+    def _load_cached_token(self):
+        """Reuse a still-valid access token left on disk by an earlier run"""
+        if not self._credentials:
+            return
+        try:
+            with open(self._token_cache_path(), 'r') as f:
+                cached = json.load(f)
+            remaining = cached['expires_at'] - time.time()
+            if remaining > 300:  # 5 min buffer
+                self.access_token = cached['token']
+                self.token_expires = time.monotonic() + remaining
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    def _save_cached_token(self, expires_in: float):
+        """Persist the access token (owner-only permissions, atomic replace)"""
+        try:
+            path = self._token_cache_path()
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'token': self.access_token, 'expires_at': time.time() + expires_in}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not cache Google access token: {e}")
+    
+    def _sign_jwt(self, payload: dict) -> str:
+        """Sign a JWT directly with the pre-loaded RSA key (RS256)"""
+        signing_input = f"{_JWT_HEADER_SEGMENT}.{_b64url(json.dumps(payload, separators=(',', ':')).encode())}"
+        signature = self._private_key.sign(signing_input.encode(), padding.PKCS1v15(), hashes.SHA256())
+        return f"{signing_input}.{_b64url(signature)}"
+    
     async def get_access_token(self):
         """Get OAuth2 access token using service account credentials"""
+        remaining = self.token_expires - time.monotonic()
+        if self.access_token and remaining > 60:
+            # Token is close to expiry but still usable - refresh in the background instead of blocking
+            if remaining < 600 and (self._refresh_task is None or self._refresh_task.done()):
+                self._refresh_task = asyncio.create_task(self._refresh_token())
+            return self.access_token
+        
+        return await self._refresh_token()
+    
+    async def _refresh_token(self):
+        """Exchange a signed service account JWT for a new access token"""
         try:
-            # Check if token is still valid
-            if self.access_token and time.time() < self.token_expires - 300:  # 5 min buffer
-                return self.access_token
-            
-            # Load service account credentials - try environment variable first, then file
-            credentials_json = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
-            if credentials_json:
-                credentials = json.loads(credentials_json)
-            elif os.path.exists(self.credentials_path):
-                with open(self.credentials_path, 'r') as f:
-                    credentials = json.load(f)
-            else:
-                logging.error(f"No credentials found: set GOOGLE_SERVICE_ACCOUNT_JSON env var or provide {self.credentials_path}")
-                return None
-            
-            # Create JWT token for service account authentication
-            now = int(time.time())
-            payload = {
-                'iss': credentials['client_email'],
-                'scope': 'https://www.googleapis.com/auth/spreadsheets',
-                'aud': 'https://oauth2.googleapis.com/token',
-                'iat': now,
-                'exp': now + 3600  # Token expires in 1 hour
-            }
-            
-            # Sign the JWT with the private key
-            private_key = credentials['private_key']
-            jwt_token = jwt.encode(payload, private_key, algorithm='RS256')
-            
-            # Exchange JWT for access token
-            token_data = {
-                'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
-                'assertion': jwt_token
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post('https://oauth2.googleapis.com/token', data=token_data) as response:
+            # Only one refresh at a time - concurrent callers wait and reuse its token
+            async with self._token_lock:
+                if self.access_token and time.monotonic() < self.token_expires - 600:
+                    return self.access_token
+                
+                if not self._credentials:
+                    logging.error(f"No credentials found: set GOOGLE_SERVICE_ACCOUNT_JSON env var or provide {self.credentials_path}")
+                    return None
+                
+                # Create JWT token for service account authentication
+                now = int(time.time())
+                payload = {
+                    'iss': self._credentials['client_email'],
+                    'scope': 'https://www.googleapis.com/auth/spreadsheets',
+                    'aud': 'https://oauth2.googleapis.com/token',
+                    'iat': now,
+                    'exp': now + 3600  # Token expires in 1 hour
+                }
+                
+                # RSA signing is CPU-bound - keep it off the event loop
+                jwt_token = await asyncio.to_thread(self._sign_jwt, payload)
+                
+                # Exchange JWT for access token (expiry tracked on the monotonic clock, immune to wall-clock jumps)
+                requested_at = time.monotonic()
+                token_data = {
+                    'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+                    'assertion': jwt_token
+                }
+                
+                async with self._request('POST', 'https://oauth2.googleapis.com/token', auth=False, data=token_data) as response:
                     if response.status == 200:
-                        token_response = await response.json()
+                        token_response = await _read_json(response)
                         self.access_token = token_response['access_token']
-                        self.token_expires = now + token_response.get('expires_in', 3600)
+                        self.token_expires = requested_at + token_response.get('expires_in', 3600)
+                        self._save_cached_token(self.token_expires - time.monotonic())
+                        # Every Sheets request picks the token up from the session's default headers
+                        session = await self._get_session()
+                        session.headers['Authorization'] = f"Bearer {self.access_token}"
                         logging.info("✅ Successfully obtained Google Sheets access token")
                         return self.access_token
                     else:
@@ -97,18 +443,26 @@ class AmbassadorSheetsManager:
             logging.error(f"Failed to get Google Sheets access token: {e}")
             return None
     
+    async def bootstrap(self) -> bool:
+        """Fetch a token once, then create any missing sheets in a single batchUpdate"""
+        if not await self.get_access_token():
+            return False
+        
+        await self.create_ambassador_sheet(auto_flush=False)
+        await self.create_submissions_sheet(auto_flush=False)
+        return await self.flush_batch()
+    
     async def full_backup_to_sheets(self):
         """Complete backup of all ambassador data and submissions to Google Sheets"""
         try:
-            # Create both sheets if they don't exist
-            await self.create_ambassador_sheet()
-            await self.create_submissions_sheet()
-            
-            # Sync ambassadors
-            ambassador_success = await self.sync_ambassadors_to_sheet()
+            # Get a token and create both sheets if they don't exist
+            await self.bootstrap()
             
-            # Sync all submissions
-            submissions_success = await self.sync_submissions_to_sheet()
+            # Sync ambassadors and all submissions concurrently (independent sheets and tables)
+            ambassador_success, submissions_success = await asyncio.gather(
+                self.sync_ambassadors_to_sheet(),
+                self.sync_submissions_to_sheet()
+            )
             
             if ambassador_success and submissions_success:
                 logging.info("✅ Complete backup to Google Sheets successful")
@@ -124,56 +478,50 @@ class AmbassadorSheetsManager:
     async def sync_ambassadors_to_sheet(self):
         """Sync all ambassador data from Supabase to Google Sheets"""
         try:
-            # Get all ambassadors from Supabase (including inactive)
-            result = self.supabase.table('ambassadors').select('*').execute()
+            # Get all ambassadors from Supabase (including inactive), count submissions for every
+            # ambassador in bulk instead of one query per ambassador, and read what the sheet holds now
+            # - all three run concurrently
+            result, sub_counts, current_sheet = await asyncio.gather(
+                asyncio.to_thread(self.supabase.table('ambassadors').select('*').execute),
+                self._count_submissions_by_ambassador(),
+                self._batch_get([AMBASSADOR_SHEET_RANGE], value_render_option="UNFORMATTED_VALUE")
+            )
             ambassadors = result.data
             
             if not ambassadors:
                 logging.info("No ambassadors found to sync")
                 return False
             
-            # Get access token
-            token = await self.get_access_token()
-            if not token:
-                raise Exception("Failed to get access token")
-            
-            # Prepare data for sheet
-            sheet_data = []
-            
-            for ambassador in ambassadors:
-                discord_id = ambassador['discord_id']
-                username = ambassador['username']
-                current_points = ambassador.get('current_month_points', 0)
-                total_points = ambassador.get('total_points', 0)
-                status = ambassador.get('status', 'active')
-                
-                # Get submissions count
-                submissions_result = self.supabase.table('submissions').select('id').eq('ambassador_id', discord_id).execute()
-                submissions_count = len(submissions_result.data)
-                
-                # Prepare row data
-                row_data = [
-                    str(discord_id),
-                    username,
-                    current_points,
-                    total_points,
-                    submissions_count,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    status.title(),
+            # Prepare data for sheet (one "Last Updated" timestamp for the whole sync)
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            sheet_data = [
+                [
+                    ambassador['discord_id'],
+                    ambassador['username'],
+                    ambassador.get('current_month_points', 0),
+                    ambassador.get('total_points', 0),
+                    sub_counts.get(ambassador['discord_id'], 0),
+                    now_str,
+                    ambassador.get('status', 'active').title(),
                     "",  # Manual Adjustments - empty initially
                     ambassador.get('notes', '')  # Notes from database
                 ]
-                
-                sheet_data.append(row_data)
+                for ambassador in ambassadors
+            ]
             
-            # Clear existing data and add headers + new data
-            await self.clear_ambassador_sheet_data()
-            await self.add_ambassador_headers()
+            # Skip the rewrite only if the sheet already holds exactly these rows (ignoring the
+            # "Last Updated" column) - compared against the sheet itself, so VA edits are never missed
+            if current_sheet is not None and (
+                _comparable_rows(current_sheet[AMBASSADOR_SHEET_RANGE]) == _comparable_rows(sheet_data)
+            ):
+                logging.info("Ambassador sheet already up to date, skipping sheet update")
+                return True
             
-            # Add all ambassador data
-            success = await self.batch_update_ambassador_sheet(sheet_data)
+            # Replace sheet contents with headers + new data
+            success = await self.batch_write_sheet("Ambassadors", self.ambassador_headers, sheet_data)
             
             if success:
+                self._invalidate_leaderboard()
                 logging.info(f"✅ Successfully synced {len(ambassadors)} ambassadors to Google Sheets")
                 return True
             else:
@@ -184,62 +532,105 @@ class AmbassadorSheetsManager:
             logging.error(f"Error syncing ambassadors to sheet: {e}")
             return False
     
-    async def sync_submissions_to_sheet(self):
-        """Sync all submissions from Supabase to Google Sheets"""
+    async def _count_submissions_by_ambassador(self, page_size: int = 1000) -> Counter:
+        """Submission count per ambassador_id, reading only that column a page at a time"""
+        counts = Counter()
+        offset = 0
+        while True:
+            # Paged because PostgREST caps rows per response (1000 by default on Supabase)
+            query = self.supabase.table('submissions').select('ambassador_id').order('id')
+            result = await asyncio.to_thread(query.range(offset, offset + page_size - 1).execute)
+            counts.update(row['ambassador_id'] for row in result.data)
+            if len(result.data) < page_size:
+                return counts
+            offset += page_size
+    
+    async def sync_submissions_to_sheet(self, page_size: int = 1000):
+        """Sync all submissions from Supabase to Google Sheets, one page at a time"""
         try:
-            # Get all submissions from Supabase
-            result = self.supabase.table('submissions').select('*').order('timestamp', desc=True).execute()
+            def fetch_page(offset):
+                # id breaks timestamp ties so offset pages never overlap or skip rows
+                query = (self.supabase.table('submissions').select('*')
+                         .order('timestamp', desc=True).order('id', desc=True))
+                return asyncio.to_thread(query.range(offset, offset + page_size - 1).execute)
+            
+            # Get the first page of submissions from Supabase, and look up all ambassador usernames
+            # once instead of one query per submission - both reads run concurrently
+            result, ambassadors_result = await asyncio.gather(
+                fetch_page(0),
+                asyncio.to_thread(self.supabase.table('ambassadors').select('discord_id,username').execute)
+            )
             submissions = result.data
             
             if not submissions:
                 logging.info("No submissions found to sync")
                 return True  # Not an error if no submissions
             
-            # Get access token
-            token = await self.get_access_token()
-            if not token:
-                raise Exception("Failed to get access token")
-            
-            # Prepare data for sheet
-            sheet_data = []
-            
-            for submission in submissions:
-                # Get ambassador username
-                ambassador_result = self.supabase.table('ambassadors').select('username').eq('discord_id', submission['ambassador_id']).execute()
-                username = ambassador_result.data[0]['username'] if ambassador_result.data else 'Unknown'
-                
-                # Prepare row data
-                row_data = [
-                    str(submission.get('id', '')),
-                    str(submission.get('ambassador_id', '')),
-                    username,
-                    submission.get('platform', ''),
-                    submission.get('post_type', ''),
-                    submission.get('url', ''),
-                    submission.get('points_awarded', 0),
-                    submission.get('timestamp', ''),
-                    submission.get('validity_status', 'pending'),
-                    submission.get('screenshot_hash', ''),
-                    str(submission.get('message_id', '')),
-                    submission.get('notes', '')
-                ]
-                
-                sheet_data.append(row_data)
-            
-            # Clear existing data and add headers + new data
-            await self.clear_submissions_sheet_data()
-            await self.add_submissions_headers()
-            
-            # Add all submission data
-            success = await self.batch_update_submissions_sheet(sheet_data)
+            username_map = {row['discord_id']: row['username'] for row in ambassadors_result.data}
             
-            if success:
-                logging.info(f"✅ Successfully synced {len(submissions)} submissions to Google Sheets")
-                return True
-            else:
+            # Clear the sheet and write just the headers; pages are appended below
+            if not await self.batch_write_sheet("Submissions", self.submissions_headers, []):
                 logging.error("❌ Failed to sync submissions to Google Sheets")
                 return False
             
+            synced_count = 0
+            pending_append = None
+            offset = 0
+            
+            try:
+                while submissions:
+                    # Prepare row data for this page
+                    sheet_data = [
+                        [
+                            str(submission.get('id', '')),
+                            submission.get('ambassador_id', ''),
+                            username_map.get(submission['ambassador_id'], 'Unknown'),
+                            submission.get('platform', ''),
+                            submission.get('post_type', ''),
+                            submission.get('url', ''),
+                            submission.get('points_awarded', 0),
+                            submission.get('timestamp', ''),
+                            submission.get('validity_status', 'pending'),
+                            submission.get('screenshot_hash', ''),
+                            _dedupe_key(submission.get('message_id')),
+                            submission.get('notes', '')
+                        ]
+                        for submission in submissions
+                    ]
+                    
+                    # Keep the append dedupe index in step with what the sheet now holds
+                    dedupe_index = self._dedupe_indexes.get(self.spreadsheet_id)
+                    if dedupe_index:
+                        dedupe_index[0].update(row[10] for row in sheet_data if row[10])
+                        dedupe_index[1].update(filter(None, (_dedupe_key(row[9]) for row in sheet_data)))
+                    
+                    # Keep pages in order: wait for the previous append before starting this one
+                    if pending_append and not await pending_append:
+                        logging.error("❌ Failed to sync submissions to Google Sheets")
+                        return False
+                    pending_append = asyncio.create_task(self.append_rows("Submissions", sheet_data))
+                    synced_count += len(submissions)
+                    
+                    if len(submissions) < page_size:
+                        break
+                    
+                    # Fetch the next page while the current one uploads
+                    offset += page_size
+                    result = await fetch_page(offset)
+                    submissions = result.data
+                
+                if await pending_append:
+                    logging.info(f"✅ Successfully synced {synced_count} submissions to Google Sheets")
+                    return True
+                else:
+                    logging.error("❌ Failed to sync submissions to Google Sheets")
+                    return False
+            finally:
+                # A page fetch or row build failed mid-upload - don't leave the append running unobserved
+                if pending_append and not pending_append.done():
+                    pending_append.cancel()
+                    logging.error("❌ Submissions sync aborted mid-upload, sheet is incomplete")
+            
         except Exception as e:
             logging.error(f"Error syncing submissions to sheet: {e}")
             return False
@@ -247,11 +638,16 @@ class AmbassadorSheetsManager:
     async def sync_from_sheets_to_supabase(self):
         """Comprehensive sync from Google Sheets back to Supabase - sheets control everything"""
         try:
-            # Sync ambassador changes
-            ambassador_success = await self.sync_ambassador_changes_from_sheet()
+            # Read both sheets in one request, then sync ambassador and submission changes concurrently
+            sheet_values = await self._batch_get([AMBASSADOR_SHEET_RANGE, SUBMISSIONS_SHEET_RANGE])
+            if sheet_values is None:
+                logging.error("Failed to read sheet data for sync")
+                return False
             
-            # Sync submission changes
-            submission_success = await self.sync_submission_changes_from_sheet()
+            ambassador_success, submission_success = await asyncio.gather(
+                self.sync_ambassador_changes_from_sheet(sheet_values[AMBASSADOR_SHEET_RANGE]),
+                self.sync_submission_changes_from_sheet(sheet_values[SUBMISSIONS_SHEET_RANGE])
+            )
             
             return ambassador_success and submission_success
             
@@ -259,353 +655,361 @@ class AmbassadorSheetsManager:
             logging.error(f"Error in comprehensive sync from sheets: {e}")
             return False
     
-    async def sync_ambassador_changes_from_sheet(self):
+    async def _upsert_rows(self, table: str, rows: List[dict], **kwargs) -> List[dict]:
+        """Upsert rows in one request, falling back to row-by-row if the batch is rejected; returns saved rows"""
+        if not rows:
+            return []
+        
+        try:
+            await asyncio.to_thread(self.supabase.table(table).upsert(rows, **kwargs).execute)
+            return rows
+        except Exception as e:
+            logging.warning(f"Batch update of {len(rows)} {table} rows failed, retrying one by one: {e}")
+        
+        saved = []
+        for row in rows:
+            try:
+                await asyncio.to_thread(self.supabase.table(table).upsert(row, **kwargs).execute)
+                saved.append(row)
+            except Exception as e:
+                logging.error(f"Failed to update {table} row: {e}")
+        return saved
+    
+    async def sync_ambassador_changes_from_sheet(self, values: Optional[List[List]] = None):
         """Sync ambassador data changes from Google Sheets to Supabase"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Get all ambassador data from the sheet
-            range_name = "Ambassadors!A2:I"  # Skip header row
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logging.error(f"Failed to read ambassador sheet data: {response.status}")
-                        return False
-                    
-                    data = await response.json()
-                    values = data.get('values', [])
-                    
-                    updates_made = 0
-                    
-                    for row in values:
-                        if len(row) >= 7:  # Minimum required columns
-                            discord_id = row[0]
-                            username = row[1] if len(row) > 1 else ""
-                            current_points = int(row[2]) if len(row) > 2 and str(row[2]).isdigit() else 0
-                            total_points = int(row[3]) if len(row) > 3 and str(row[3]).isdigit() else 0
-                            status = row[6].lower() if len(row) > 6 else "active"
-                            manual_adjustment = row[7] if len(row) > 7 else ""
-                            notes = row[8] if len(row) > 8 else ""
-                            
-                            # Apply manual adjustment if present
-                            if manual_adjustment and manual_adjustment.strip():
-                                try:
-                                    adjustment_value = int(manual_adjustment.strip())
-                                    current_points += adjustment_value
-                                    total_points += adjustment_value
-                                    # Clear adjustment after applying
-                                    await self.clear_cell(f"Ambassadors!H{values.index(row) + 2}")
-                                except ValueError:
-                                    logging.warning(f"Invalid manual adjustment: {manual_adjustment}")
-                            
-                            # Update ambassador in Supabase with sheet data
-                            try:
-                                self.supabase.table('ambassadors').upsert({
-                                    'discord_id': discord_id,
-                                    'username': username,
-                                    'current_month_points': max(0, current_points),
-                                    'total_points': max(0, total_points),
-                                    'status': status,
-                                    'notes': notes,
-                                    'last_updated': datetime.now().isoformat()
-                                }).execute()
-                                
-                                updates_made += 1
-                                
-                            except Exception as e:
-                                logging.error(f"Failed to update ambassador {discord_id}: {e}")
+            # Get all ambassador data from the sheet unless the caller already read it
+            if values is None:
+                sheet_values = await self._batch_get([AMBASSADOR_SHEET_RANGE])
+                if sheet_values is None:
+                    logging.error("Failed to read ambassador sheet data")
+                    return False
+                values = sheet_values[AMBASSADOR_SHEET_RANGE]
+            
+            now_iso = datetime.now().isoformat()
+            ambassador_batch: List[dict] = []
+            adjusted_rows: Dict[str, int] = {}  # discord_id -> sheet row with an applied adjustment
+            
+            for row_number, row in enumerate(values, start=2):  # Sheet rows start after the header
+                if len(row) >= 7:  # Minimum required columns
+                    row = row + [""] * (9 - len(row))  # Sheets drops trailing empty cells
+                    discord_id = row[0]
+                    username = row[1]
+                    current_points = _to_int(row[2])
+                    total_points = _to_int(row[3])
+                    status = row[6].lower()
+                    manual_adjustment = row[7]
+                    notes = row[8]
                     
-                    if updates_made > 0:
-                        logging.info(f"✅ Updated {updates_made} ambassadors from Google Sheets")
+                    # Apply manual adjustment if present
+                    if manual_adjustment and manual_adjustment.strip():
+                        try:
+                            adjustment_value = int(manual_adjustment.strip())
+                            current_points += adjustment_value
+                            total_points += adjustment_value
+                            # Clear adjustment after applying (flushed in one request below)
+                            adjusted_rows[discord_id] = row_number
+                        except ValueError:
+                            logging.warning(f"Invalid manual adjustment: {manual_adjustment}")
                     
-                    return True
+                    # Queue ambassador update for Supabase with sheet data
+                    ambassador_batch.append({
+                        'discord_id': discord_id,
+                        'username': username,
+                        'current_month_points': max(0, current_points),
+                        'total_points': max(0, total_points),
+                        'status': status,
+                        'notes': notes,
+                        'last_updated': now_iso
+                    })
+            
+            # Update all ambassadors in Supabase in one request
+            saved = await self._upsert_rows('ambassadors', ambassador_batch, on_conflict='discord_id')
+            updates_made = len(saved)
+            
+            # Once applied adjustments are safely stored, write just those rows' new points back and
+            # clear their adjustment cells in one request - no full re-sync of the sheet needed
+            sheet_updates = []
+            for row in saved:
+                row_number = adjusted_rows.get(row['discord_id'])
+                if row_number:
+                    sheet_updates += [
+                        (f"Ambassadors!C{row_number}", row['current_month_points']),
+                        (f"Ambassadors!D{row_number}", row['total_points']),
+                        (f"Ambassadors!H{row_number}", "")
+                    ]
+            if sheet_updates:
+                await self.update_ranges(sheet_updates)
+                self._invalidate_leaderboard()
+            
+            if updates_made > 0:
+                logging.info(f"✅ Updated {updates_made} ambassadors from Google Sheets")
+            
+            return True
             
         except Exception as e:
             logging.error(f"Error syncing ambassador changes from sheet: {e}")
             return False
     
-    async def sync_submission_changes_from_sheet(self):
+    async def sync_submission_changes_from_sheet(self, values: Optional[List[List]] = None):
         """Sync submission data changes from Google Sheets to Supabase"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Get all submission data from the sheet
-            range_name = "Submissions!A2:L"  # Skip header row
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logging.error(f"Failed to read submissions sheet data: {response.status}")
-                        return False
-                    
-                    data = await response.json()
-                    values = data.get('values', [])
+            # Get all submission data from the sheet unless the caller already read it
+            if values is None:
+                sheet_values = await self._batch_get([SUBMISSIONS_SHEET_RANGE])
+                if sheet_values is None:
+                    logging.error("Failed to read submissions sheet data")
+                    return False
+                values = sheet_values[SUBMISSIONS_SHEET_RANGE]
+            
+            updates_made = 0
+            to_update: List[dict] = []
+            to_insert: List[dict] = []
+            insert_rows: List[int] = []
+            id_updates: List[tuple] = []
+            
+            for row_number, row in enumerate(values, start=2):  # Sheet rows start after the header
+                if len(row) >= 9:  # Minimum required columns
+                    row = row + [""] * (12 - len(row))  # Sheets drops trailing empty cells
+                    submission_id = row[0] if row[0] else None
+                    ambassador_id = row[1]
+                    platform = row[3]
+                    post_type = row[4]
+                    url = row[5]
+                    points_awarded = _to_int(row[6])
+                    timestamp = row[7]
+                    status = row[8]
+                    screenshot_hash = row[9]
+                    message_id = row[10]
+                    notes = row[11]
                     
-                    updates_made = 0
+                    submission_data = {
+                        'ambassador_id': ambassador_id,
+                        'platform': platform,
+                        'post_type': post_type,
+                        'url': url,
+                        'points_awarded': points_awarded,
+                        'timestamp': timestamp,
+                        'validity_status': status,
+                        'screenshot_hash': screenshot_hash,
+                        'message_id': message_id,
+                        'notes': notes
+                    }
                     
-                    for row in values:
-                        if len(row) >= 9:  # Minimum required columns
-                            submission_id = row[0] if row[0] else None
-                            ambassador_id = row[1]
-                            platform = row[3] if len(row) > 3 else ""
-                            post_type = row[4] if len(row) > 4 else ""
-                            url = row[5] if len(row) > 5 else ""
-                            points_awarded = int(row[6]) if len(row) > 6 and str(row[6]).isdigit() else 0
-                            timestamp = row[7] if len(row) > 7 else ""
-                            status = row[8] if len(row) > 8 else "pending"
-                            screenshot_hash = row[9] if len(row) > 9 else ""
-                            message_id = row[10] if len(row) > 10 else ""
-                            notes = row[11] if len(row) > 11 else ""
-                            
-                            # Update or insert submission in Supabase
-                            try:
-                                submission_data = {
-                                    'ambassador_id': ambassador_id,
-                                    'platform': platform,
-                                    'post_type': post_type,
-                                    'url': url,
-                                    'points_awarded': points_awarded,
-                                    'timestamp': timestamp,
-                                    'validity_status': status,
-                                    'screenshot_hash': screenshot_hash,
-                                    'message_id': message_id,
-                                    'notes': notes
-                                }
-                                
-                                if submission_id and submission_id.isdigit():
-                                    # Update existing submission
-                                    submission_data['id'] = int(submission_id)
-                                    self.supabase.table('submissions').upsert(submission_data).execute()
-                                else:
-                                    # Insert new submission
-                                    result = self.supabase.table('submissions').insert(submission_data).execute()
-                                    # Update sheet with new ID
-                                    if result.data:
-                                        new_id = result.data[0]['id']
-                                        await self.update_cell(f"Submissions!A{values.index(row) + 2}", str(new_id))
-                                
-                                updates_made += 1
-                                
-                            except Exception as e:
-                                logging.error(f"Failed to update submission {submission_id}: {e}")
+                    if submission_id and submission_id.isdigit():
+                        # Existing submission - update
+                        submission_data['id'] = int(submission_id)
+                        to_update.append(submission_data)
+                    else:
+                        # New submission - insert, remembering its sheet row for the ID write-back
+                        to_insert.append(submission_data)
+                        insert_rows.append(row_number)
+            
+            # Update existing submissions in one request
+            updates_made += len(await self._upsert_rows('submissions', to_update))
+            
+            # Insert new submissions in one request, falling back to row-by-row if the batch is rejected
+            if to_insert:
+                try:
+                    result = await asyncio.to_thread(self.supabase.table('submissions').insert(to_insert).execute)
+                    updates_made += len(to_insert)
                     
-                    if updates_made > 0:
-                        logging.info(f"✅ Updated {updates_made} submissions from Google Sheets")
+                    # Update sheet with new IDs (inserted rows come back in request order)
+                    for row_number, inserted in zip(insert_rows, result.data or []):
+                        id_updates.append((f"Submissions!A{row_number}", str(inserted['id'])))
+                except Exception as e:
+                    logging.warning(f"Batch insert of {len(to_insert)} submissions failed, retrying one by one: {e}")
                     
-                    return True
+                    for row_number, submission_data in zip(insert_rows, to_insert):
+                        try:
+                            result = await asyncio.to_thread(self.supabase.table('submissions').insert(submission_data).execute)
+                            updates_made += 1
+                            if result.data:
+                                id_updates.append((f"Submissions!A{row_number}", str(result.data[0]['id'])))
+                        except Exception as e:
+                            logging.error(f"Failed to insert submission from sheet row {row_number}: {e}")
+            
+            if id_updates:
+                await self.update_ranges(id_updates)
+            
+            if updates_made > 0:
+                logging.info(f"✅ Updated {updates_made} submissions from Google Sheets")
+            
+            return True
             
         except Exception as e:
             logging.error(f"Error syncing submission changes from sheet: {e}")
             return False
     
-    async def clear_cell(self, cell_range: str):
-        """Clear a specific cell in the sheet"""
+    async def _batch_get(self, ranges: List[str], value_render_option: str = "FORMATTED_VALUE") -> Optional[Dict[str, List[List]]]:
+        """Read several ranges in a single values:batchGet request, keyed by requested range"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{cell_range}:clear"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    return response.status == 200
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchGet"
+            params = [('ranges', range_name) for range_name in ranges]
+            params.append(('valueRenderOption', value_render_option))
+            
+            async with self._request('GET', url, params=params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logging.error(f"Failed to read ranges {ranges}: {response.status} - {error_text}")
+                    return None
+                
+                data = await _read_json(response)
+                # valueRanges come back in request order; empty ranges have no 'values' key
+                return {
+                    range_name: value_range.get('values', [])
+                    for range_name, value_range in zip(ranges, data.get('valueRanges', []))
+                }
             
         except Exception as e:
-            logging.error(f"Error clearing cell {cell_range}: {e}")
-            return False
+            logging.error(f"Error reading ranges {ranges}: {e}")
+            return None
+    
+    async def clear_cell(self, cell_range: str):
+        """Clear a specific cell in the sheet"""
+        return await self.clear_ranges([cell_range])
     
     async def update_cell(self, cell_range: str, value: str):
         """Update a specific cell in the sheet"""
+        return await self.update_ranges([(cell_range, value)])
+    
+    async def clear_ranges(self, ranges: List[str]):
+        """Clear several ranges in a single values:batchClear request"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
             body = {
-                "values": [[value]]
+                "ranges": ranges
             }
             
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{cell_range}"
-            params = {
-                "valueInputOption": "USER_ENTERED"
-            }
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchClear"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    return response.status == 200
+            async with self._request('POST', url, json=body) as response:
+                return response.status == 200
             
         except Exception as e:
-            logging.error(f"Error updating cell {cell_range}: {e}")
+            logging.error(f"Error clearing ranges {ranges}: {e}")
             return False
     
-    async def batch_update_ambassador_sheet(self, data: List[List]):
-        """Batch update ambassador sheet with data"""
+    async def update_ranges(self, updates: List[tuple]):
+        """Write several (range, value) cells in a single values:batchUpdate request"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Start from row 2 (after headers)
-            range_name = f"Ambassadors!A2:I{len(data) + 1}"
             body = {
-                "values": data
+                "valueInputOption": "RAW",
+                "data": [{"range": cell_range, "values": [[value]]} for cell_range, value in updates]
             }
             
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            params = {
-                "valueInputOption": "USER_ENTERED"
-            }
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchUpdate"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to batch update ambassador sheet: {response.status} - {error_text}")
-                        return False
+            async with self._request('POST', url, json=body) as response:
+                return response.status == 200
             
         except Exception as e:
-            logging.error(f"Error in ambassador batch update: {e}")
+            logging.error(f"Error updating ranges: {e}")
             return False
     
-    async def batch_update_submissions_sheet(self, data: List[List]):
-        """Batch update submissions sheet with data"""
+    async def batch_write_sheet(self, sheet_name: str, header_row: List[str], rows: List[List]) -> bool:
+        """Replace a sheet's contents with a header row plus data rows (one clear + one write request)"""
+        # With a cached sheetId (and enough rows in the grid) clear + write go out as one request
+        grid = self._sheet_grids.get(sheet_name)
+        if grid and len(rows) + 1 <= grid[1]:
+            return await self._replace_sheet_cells(sheet_name, grid[0], header_row, rows)
+        
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
+            last_column = chr(ord('A') + len(header_row) - 1)
             
-            # Start from row 2 (after headers)
-            range_name = f"Submissions!A2:L{len(data) + 1}"
-            body = {
-                "values": data
+            # Clear existing data across the full width of the sheet
+            clear_url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchClear"
+            clear_body = {
+                "ranges": [f"{sheet_name}!A:{last_column}"]
             }
             
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            params = {
-                "valueInputOption": "USER_ENTERED"
+            async with self._request('POST', clear_url, json=clear_body) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logging.error(f"Failed to clear {sheet_name} sheet: {response.status} - {error_text}")
+                    return False
+            
+            # Write headers and data in a single request
+            write_url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchUpdate"
+            write_body = {
+                "valueInputOption": "RAW",
+                "data": [
+                    {
+                        "range": f"{sheet_name}!A1:{last_column}{len(rows) + 1}",
+                        "values": [header_row] + rows
+                    }
+                ]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to batch update submissions sheet: {response.status} - {error_text}")
-                        return False
+            async with self._request('POST', write_url, data=_json_bytes(write_body), headers=JSON_CONTENT_TYPE) as response:
+                if response.status == 200:
+                    return True
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Failed to write {sheet_name} sheet: {response.status} - {error_text}")
+                    return False
             
         except Exception as e:
-            logging.error(f"Error in submissions batch update: {e}")
+            logging.error(f"Error writing {sheet_name} sheet: {e}")
             return False
     
-    async def clear_ambassador_sheet_data(self):
-        """Clear existing data from the ambassador sheet"""
+    async def _replace_sheet_cells(self, sheet_name: str, sheet_id: int, header_row: List[str], rows: List[List]) -> bool:
+        """Clear a sheet's columns and write header + rows in a single spreadsheets:batchUpdate"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Clear data range (keep some buffer)
-            range_name = "Ambassadors!A1:I1000"
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}:batchUpdate"
             body = {
-                "values": []
+                "requests": [
+                    # No row bounds - clears every row that ever had data in these columns
+                    {"updateCells": {
+                        "range": {"sheetId": sheet_id, "startColumnIndex": 0, "endColumnIndex": len(header_row)},
+                        "fields": "userEnteredValue"
+                    }},
+                    {"updateCells": {
+                        "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                        "rows": [{"values": [_cell(value) for value in row]} for row in [header_row] + rows],
+                        "fields": "userEnteredValue"
+                    }}
+                ]
             }
             
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}:clear"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    return response.status == 200
+            async with self._request('POST', url, data=_json_bytes(body), headers=JSON_CONTENT_TYPE) as response:
+                if response.status == 200:
+                    return True
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Failed to write {sheet_name} sheet: {response.status} - {error_text}")
+                    return False
             
         except Exception as e:
-            logging.error(f"Error clearing ambassador sheet: {e}")
+            logging.error(f"Error writing {sheet_name} sheet: {e}")
             return False
     
-    async def clear_submissions_sheet_data(self):
-        """Clear existing data from the submissions sheet"""
+    async def append_rows(self, sheet_name: str, rows: List[List]) -> bool:
+        """Append rows after the last filled row of a sheet (values:append)"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Clear data range (keep some buffer)
-            range_name = "Submissions!A1:L1000"
             body = {
-                "values": []
+                "values": rows
             }
             
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}:clear"
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{sheet_name}!A1:append"
+            params = {
+                "valueInputOption": "RAW"
+            }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    return response.status == 200
+            async with self._request('POST', url, params=params, data=_json_bytes(body), headers=JSON_CONTENT_TYPE) as response:
+                if response.status == 200:
+                    return True
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Failed to append to {sheet_name} sheet: {response.status} - {error_text}")
+                    return False
             
         except Exception as e:
-            logging.error(f"Error clearing submissions sheet: {e}")
+            logging.error(f"Error appending to {sheet_name} sheet: {e}")
             return False
     
     async def add_ambassador_headers(self):
         """Add headers to the ambassador sheet"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
             range_name = "Ambassadors!A1:I1"
             body = {
                 "values": [self.ambassador_headers]
@@ -613,12 +1017,11 @@ class AmbassadorSheetsManager:
             
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
             params = {
-                "valueInputOption": "USER_ENTERED"
+                "valueInputOption": "RAW"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    return response.status == 200
+            async with self._request('PUT', url, params=params, json=body) as response:
+                return response.status == 200
             
         except Exception as e:
             logging.error(f"Error adding ambassador headers: {e}")
@@ -627,15 +1030,6 @@ class AmbassadorSheetsManager:
     async def add_submissions_headers(self):
         """Add headers to the submissions sheet"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
             range_name = "Submissions!A1:L1"
             body = {
                 "values": [self.submissions_headers]
@@ -643,114 +1037,119 @@ class AmbassadorSheetsManager:
             
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
             params = {
-                "valueInputOption": "USER_ENTERED"
+                "valueInputOption": "RAW"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    return response.status == 200
+            async with self._request('PUT', url, params=params, json=body) as response:
+                return response.status == 200
             
         except Exception as e:
             logging.error(f"Error adding submissions headers: {e}")
             return False
     
-    async def create_ambassador_sheet(self):
-        """Create the Ambassadors sheet if it doesn't exist"""
+    async def flush_batch(self) -> bool:
+        """Send all queued spreadsheet requests (addSheet, formatting, ...) in a single batchUpdate"""
+        requests, self._pending_requests = self._pending_requests, []
+        if not requests:
+            return True
+        
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Add a new sheet named "Ambassadors"
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}:batchUpdate"
             
-            body = {
-                "requests": [
-                    {
-                        "addSheet": {
-                            "properties": {
-                                "title": "Ambassadors",
-                                "gridProperties": {
-                                    "rowCount": 1000,
-                                    "columnCount": 10
-                                }
-                            }
-                        }
-                    }
-                ]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        logging.info("✅ Created Ambassadors sheet")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        # Sheet might already exist
-                        if "already exists" in error_text.lower():
-                            logging.info("Ambassadors sheet already exists")
-                            return True
-                        logging.error(f"Failed to create sheet: {error_text}")
-                        return False
+            async with self._request('POST', url, json={"requests": requests}) as response:
+                if response.status == 200:
+                    data = await _read_json(response)
+                    self._mark_sheets_ready(requests, data.get('replies', []))
+                    return True
+                error_body = await response.json(content_type=None)
             
         except Exception as e:
-            logging.error(f"Error creating ambassador sheet: {e}")
+            logging.error(f"Error applying sheet updates: {e}")
             return False
+        
+        # Sheet might already exist
+        if _is_already_exists(error_body):
+            if len(requests) == 1:
+                self._mark_sheets_ready(requests)
+                return True
+            
+            # batchUpdate is all-or-nothing - resend one at a time so the other requests still apply
+            results = []
+            for request in requests:
+                self._pending_requests.append(request)
+                results.append(await self.flush_batch())
+            return all(results)
+        
+        logging.error(f"Failed to apply sheet updates: {error_body}")
+        return False
     
-    async def create_submissions_sheet(self):
-        """Create the Submissions sheet if it doesn't exist"""
+    async def _load_sheet_titles(self):
+        """Read the spreadsheet's existing sheet titles once per process (a read, not a write)"""
+        if self.spreadsheet_id in self._titles_loaded:
+            return
+        
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}"
+            params = {"fields": "sheets.properties(title,sheetId,gridProperties.rowCount)"}
             
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Add a new sheet named "Submissions"
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}:batchUpdate"
+            async with self._request('GET', url, params=params) as response:
+                if response.status != 200:
+                    logging.warning(f"Could not list sheets: {response.status}")
+                    return
+                data = await _read_json(response)
             
-            body = {
-                "requests": [
-                    {
-                        "addSheet": {
-                            "properties": {
-                                "title": "Submissions",
-                                "gridProperties": {
-                                    "rowCount": 5000,
-                                    "columnCount": 12
-                                }
-                            }
-                        }
-                    }
-                ]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        logging.info("✅ Created Submissions sheet")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        # Sheet might already exist
-                        if "already exists" in error_text.lower():
-                            logging.info("Submissions sheet already exists")
-                            return True
-                        logging.error(f"Failed to create submissions sheet: {error_text}")
-                        return False
+            for sheet in data.get('sheets', []):
+                self._remember_sheet(sheet['properties'])
+            self._titles_loaded.add(self.spreadsheet_id)
             
         except Exception as e:
-            logging.error(f"Error creating submissions sheet: {e}")
-            return False
+            logging.warning(f"Error listing sheets: {e}")
+    
+    def _mark_sheets_ready(self, requests: List[dict], replies: List[dict] = ()):
+        """Remember sheets that were created (or found to exist) by a successful batchUpdate"""
+        for request in requests:
+            if 'addSheet' in request:
+                self._known_sheets.add(request['addSheet']['properties']['title'])
+        for reply in replies:
+            if 'addSheet' in reply:
+                self._remember_sheet(reply['addSheet']['properties'])
+    
+    def _remember_sheet(self, properties: dict):
+        """Record a sheet's title, numeric sheetId and grid height"""
+        title = properties['title']
+        self._known_sheets.add(title)
+        row_count = properties.get('gridProperties', {}).get('rowCount', 0)
+        self._sheet_grids[title] = (properties['sheetId'], row_count)
+    
+    async def create_ambassador_sheet(self, auto_flush: bool = True):
+        """Create the Ambassadors sheet if it doesn't exist (queued only when auto_flush is False)"""
+        await self._load_sheet_titles()
+        if "Ambassadors" in self._known_sheets:
+            return True
+        self._pending_requests.append(_ADD_AMBASSADORS_SHEET)
+        
+        if not auto_flush:
+            return True
+        
+        success = await self.flush_batch()
+        if success:
+            logging.info("✅ Ambassadors sheet ready")
+        return success
+    
+    async def create_submissions_sheet(self, auto_flush: bool = True):
+        """Create the Submissions sheet if it doesn't exist (queued only when auto_flush is False)"""
+        await self._load_sheet_titles()
+        if "Submissions" in self._known_sheets:
+            return True
+        self._pending_requests.append(_ADD_SUBMISSIONS_SHEET)
+        
+        if not auto_flush:
+            return True
+        
+        success = await self.flush_batch()
+        if success:
+            logging.info("✅ Submissions sheet ready")
+        return success
 
     # ============================================
     # VA-SAFE METHODS - Preserve manual edits
@@ -759,71 +1158,70 @@ class AmbassadorSheetsManager:
     async def get_existing_sheet_data(self, sheet_name: str, range_spec: str) -> List[List]:
         """Read existing data from sheet without modifying it"""
         try:
-            token = await self.get_access_token()
-            if not token:
-                return []
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{sheet_name}!{range_spec}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get('values', [])
-                    else:
-                        logging.warning(f"Could not read {sheet_name}: {response.status}")
-                        return []
-                        
+            async with self._request('GET', url) as response:
+                if response.status == 200:
+                    data = await _read_json(response)
+                    return data.get('values', [])
+                else:
+                    logging.warning(f"Could not read {sheet_name}: {response.status}")
+                    return []
+                    
         except Exception as e:
             logging.error(f"Error reading sheet data: {e}")
             return []
     
+    async def _prime_dedupe_cache(self) -> Tuple[set, set]:
+        """Message IDs and screenshot hashes already in the Submissions sheet, read once per process"""
+        # Every caller shares the same sets, so keys reserved while another call is still
+        # reading the sheet are never dropped
+        index = self._dedupe_indexes.setdefault(self.spreadsheet_id, (set(), set()))
+        if self.spreadsheet_id in self._dedupe_loaded:
+            return index
+        
+        # Only the hash + message ID columns are needed (J:K instead of A:L)
+        existing_data = await self.get_existing_sheet_data("Submissions", "J:K")
+        if not existing_data:
+            # Empty sheet - add headers first; not marked loaded so a failed read is retried next time
+            await self.add_submissions_headers()
+            return index
+        
+        seen_message_ids, seen_hashes = index
+        seen_hashes.update(filter(None, (_dedupe_key(row[0]) for row in existing_data[1:] if len(row) > 0)))
+        seen_message_ids.update(filter(None, (_dedupe_key(row[1]) for row in existing_data[1:] if len(row) > 1)))
+        self._dedupe_loaded.add(self.spreadsheet_id)
+        return index
+    
     async def append_submission_va_safe(self, submission_data: dict, username: str) -> bool:
         """
         Append a single submission to the sheet WITHOUT overwriting VA edits.
         This method:
-        1. Reads existing data to find next empty row
+        1. Loads the message IDs / screenshot hashes already in the sheet (once per process)
         2. Checks if submission already exists (by message_id or screenshot_hash)
-        3. Only appends if not duplicate
+        3. Only appends if not duplicate (values:append picks the next row server-side)
         """
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
             # First, ensure the Submissions sheet exists with headers
             await self.create_submissions_sheet()
             
-            # Read existing submissions to check for duplicates and find next row
-            existing_data = await self.get_existing_sheet_data("Submissions", "A:L")
+            # Check for duplicate by message_id or screenshot_hash
+            seen_message_ids, seen_hashes = await self._prime_dedupe_cache()
+            message_id = _dedupe_key(submission_data.get('message_id'))
+            screenshot_hash = _dedupe_key(submission_data.get('screenshot_hash'))
             
-            # If no data, add headers first
-            if not existing_data:
-                await self.add_submissions_headers()
-                next_row = 2
-            else:
-                next_row = len(existing_data) + 1
-                
-                # Check for duplicate by message_id or screenshot_hash
-                message_id = str(submission_data.get('message_id', ''))
-                screenshot_hash = submission_data.get('screenshot_hash', '')
-                
-                for row in existing_data[1:]:  # Skip header
-                    if len(row) >= 11:
-                        existing_msg_id = str(row[10]) if len(row) > 10 else ''
-                        existing_hash = str(row[9]) if len(row) > 9 else ''
-                        
-                        if message_id and existing_msg_id == message_id:
-                            logging.info(f"Submission already exists (message_id: {message_id})")
-                            return True  # Already exists, not an error
-                        if screenshot_hash and existing_hash == screenshot_hash:
-                            logging.info(f"Submission already exists (hash: {screenshot_hash})")
-                            return True
+            if message_id and message_id in seen_message_ids:
+                logging.info(f"Submission already exists (message_id: {message_id})")
+                return True  # Already exists, not an error
+            if screenshot_hash and screenshot_hash in seen_hashes:
+                logging.info(f"Submission already exists (hash: {screenshot_hash})")
+                return True
+            
+            # Reserve the keys before the append so a concurrent duplicate is caught too
+            if message_id:
+                seen_message_ids.add(message_id)
+            if screenshot_hash:
+                seen_hashes.add(screenshot_hash)
             
             # Prepare row data
             row_data = [
@@ -837,32 +1235,20 @@ class AmbassadorSheetsManager:
                 submission_data.get('timestamp', ''),
                 submission_data.get('validity_status', 'pending'),
                 submission_data.get('screenshot_hash', ''),
-                str(submission_data.get('message_id', '')),
+                message_id,
                 submission_data.get('notes', '')
             ]
             
-            # Append to sheet
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            range_name = f"Submissions!A{next_row}:L{next_row}"
-            body = {"values": [row_data]}
-            
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            params = {"valueInputOption": "USER_ENTERED"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    if response.status == 200:
-                        logging.info(f"✅ Appended submission to row {next_row}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to append submission: {error_text}")
-                        return False
-                        
+            # Append to sheet - the next empty row is resolved atomically by the API
+            if await self.append_rows("Submissions", [row_data]):
+                logging.info(f"✅ Appended submission {submission_data.get('id', '')} to sheet")
+                return True
+            else:
+                seen_message_ids.discard(message_id)
+                seen_hashes.discard(screenshot_hash)
+                logging.error("Failed to append submission")
+                return False
+                    
         except Exception as e:
             logging.error(f"Error appending submission: {e}")
             return False
@@ -877,82 +1263,115 @@ class AmbassadorSheetsManager:
         2. Preserves columns H (Manual Adjustments) and I (Notes)
         3. Only updates points columns
         """
+        return await self.bulk_update_ambassadors([{
+            'discord_id': discord_id,
+            'username': username,
+            'current_points': current_points,
+            'total_points': total_points,
+            'submissions_count': submissions_count
+        }])
+    
+    async def bulk_update_ambassadors(self, updates: List[dict]) -> bool:
+        """
+        Update many ambassadors with one sheet read and one values:batchUpdate, preserving
+        VA manual adjustments and notes like update_ambassador_points_va_safe.
+        Each update has discord_id, username, current_points, total_points, submissions_count.
+        """
         try:
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
             # Ensure Ambassadors sheet exists
             await self.create_ambassador_sheet()
             
-            # Read existing data
-            existing_data = await self.get_existing_sheet_data("Ambassadors", "A:I")
+            # Read only the columns we use: IDs (A) and VA edits (H:I), in one request.
+            # Unformatted so numbers come back as numbers and can be written back RAW
+            id_range, va_range = "Ambassadors!A:A", "Ambassadors!H:I"
+            sheet_values = await self._batch_get([id_range, va_range], value_render_option="UNFORMATTED_VALUE")
+            if sheet_values is None:
+                return False
+            id_column = sheet_values[id_range]
+            va_columns = sheet_values[va_range]
             
-            # If no data, add headers and this ambassador
-            if not existing_data:
+            # If no data, add headers first
+            if not id_column:
                 await self.add_ambassador_headers()
-                row_num = 2
-                manual_adjustment = ""
-                notes = ""
-            else:
-                # Find ambassador row by discord_id
-                row_num = None
-                manual_adjustment = ""
-                notes = ""
-                
-                for i, row in enumerate(existing_data[1:], start=2):  # Skip header
-                    if len(row) > 0 and str(row[0]) == str(discord_id):
-                        row_num = i
-                        # Preserve VA edits
-                        manual_adjustment = row[7] if len(row) > 7 else ""
-                        notes = row[8] if len(row) > 8 else ""
-                        break
-                
-                if row_num is None:
+                id_column = [[self.ambassador_headers[0]]]
+            
+            # Index ambassador rows by discord_id (first occurrence wins)
+            rows_by_id: Dict[str, tuple] = {}
+            for i, id_row in enumerate(id_column[1:], start=1):  # Skip header
+                if id_row:
+                    va_row = va_columns[i] if i < len(va_columns) else []
+                    rows_by_id.setdefault(_discord_id_text(id_row[0]), (i + 1, va_row))
+            next_row = len(id_column) + 1
+            
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            data = []
+            
+            for update in updates:
+                discord_id = str(update['discord_id'])
+                # Rows written before RAW hold the ID as a (rounded) number - match those too,
+                # so the row is rewritten with the exact ID instead of duplicated
+                legacy_id = _discord_id_text(float(discord_id)) if discord_id.isdigit() else discord_id
+                existing = rows_by_id.get(discord_id) or rows_by_id.get(legacy_id)
+                if existing:
+                    row_num, row = existing
+                    # Preserve VA edits
+                    manual_adjustment = row[0] if len(row) > 0 else ""
+                    notes = row[1] if len(row) > 1 else ""
+                else:
                     # New ambassador, append at end
-                    row_num = len(existing_data) + 1
-            
-            # Prepare row data (preserving manual adjustments and notes)
-            row_data = [
-                str(discord_id),
-                username,
-                current_points,
-                total_points,
-                submissions_count,
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "Active",
-                manual_adjustment,  # Preserve VA manual adjustments
-                notes  # Preserve VA notes
-            ]
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
+                    row_num, manual_adjustment, notes = next_row, "", ""
+                    rows_by_id[discord_id] = (row_num, [])
+                    next_row += 1
+                
+                # Prepare row data (preserving manual adjustments and notes)
+                data.append({
+                    "range": f"Ambassadors!A{row_num}:I{row_num}",
+                    "values": [[
+                        discord_id,
+                        update['username'],
+                        update['current_points'],
+                        update['total_points'],
+                        update['submissions_count'],
+                        now_str,
+                        "Active",
+                        manual_adjustment,  # Preserve VA manual adjustments
+                        notes  # Preserve VA notes
+                    ]]
+                })
+            
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values:batchUpdate"
+            # RAW so Discord IDs stay text instead of being parsed into lossy numbers
+            body = {
+                "valueInputOption": "RAW",
+                "data": data
             }
             
-            range_name = f"Ambassadors!A{row_num}:I{row_num}"
-            body = {"values": [row_data]}
-            
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
-            params = {"valueInputOption": "USER_ENTERED"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, params=params, json=body) as response:
-                    if response.status == 200:
-                        logging.info(f"✅ Updated ambassador {username} at row {row_num}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to update ambassador: {error_text}")
-                        return False
-                        
+            async with self._request('POST', url, json=body) as response:
+                if response.status == 200:
+                    self._invalidate_leaderboard()
+                    logging.info(f"✅ Updated {len(updates)} ambassador(s) in sheet")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Failed to update ambassadors: {error_text}")
+                    return False
+                    
         except Exception as e:
-            logging.error(f"Error updating ambassador: {e}")
+            logging.error(f"Error updating ambassadors: {e}")
             return False
     
-    async def get_leaderboard_data(self, limit: int = 10) -> List[dict]:
+    def _invalidate_leaderboard(self):
+        """Drop the cached leaderboard after the Ambassadors sheet changes"""
+        self._leaderboard_cache.pop(self.spreadsheet_id, None)
+    
+    async def get_leaderboard_data(self, limit: int = 10, use_cache: bool = True) -> List[dict]:
         """Get leaderboard data from sheet (respects VA manual adjustments)"""
         try:
+            # Leaderboard commands tolerate a little staleness - serve bursts from memory
+            cached = self._leaderboard_cache.get(self.spreadsheet_id)
+            if use_cache and cached and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL:
+                return cached[1][:limit]
+            
             existing_data = await self.get_existing_sheet_data("Ambassadors", "A:I")
             
             if not existing_data or len(existing_data) < 2:
@@ -983,6 +1402,7 @@ class AmbassadorSheetsManager:
             
             # Sort by current month points descending
             leaderboard.sort(key=lambda x: x['current_month_points'], reverse=True)
+            self._leaderboard_cache[self.spreadsheet_id] = (time.monotonic(), leaderboard)
             
             return leaderboard[:limit]
             
@@ -1000,15 +1420,6 @@ class AmbassadorSheetsManager:
             if not month_year:
                 month_year = datetime.now().strftime("%b %Y")  # e.g., "Nov 2025"
             
-            token = await self.get_access_token()
-            if not token:
-                return False
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
             # Create monthly archive sheet
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}:batchUpdate"
             body = {
@@ -1022,16 +1433,15 @@ class AmbassadorSheetsManager:
                 }]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        if "already exists" not in error_text.lower():
-                            logging.error(f"Failed to create monthly sheet: {error_text}")
-                            return False
+            async with self._request('POST', url, json=body) as response:
+                if response.status != 200:
+                    error_body = await response.json(content_type=None)
+                    if not _is_already_exists(error_body):
+                        logging.error(f"Failed to create monthly sheet: {error_body}")
+                        return False
             
             # Get current leaderboard data
-            leaderboard = await self.get_leaderboard_data(limit=50)
+            leaderboard = await self.get_leaderboard_data(limit=50, use_cache=False)
             
             if not leaderboard:
                 logging.warning("No leaderboard data to archive")
@@ -1042,6 +1452,7 @@ class AmbassadorSheetsManager:
                 ["Rank", "Username", "Discord ID", "Monthly Points", "Total Points", "Goal Met", "Archived Date"]
             ]
             
+            archived_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             for i, amb in enumerate(leaderboard, 1):
                 goal_met = "✅ Yes" if amb['current_month_points'] >= 75 else "❌ No"
                 archive_data.append([
@@ -1051,7 +1462,7 @@ class AmbassadorSheetsManager:
                     amb['current_month_points'],
                     amb['total_points'],
                     goal_met,
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    archived_at
                 ])
             
             # Write to monthly sheet
@@ -1061,16 +1472,15 @@ class AmbassadorSheetsManager:
             write_url = f"https://sheets.googleapis.com/v4/spreadsheets/{self.spreadsheet_id}/values/{range_name}"
             params = {"valueInputOption": "USER_ENTERED"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(write_url, headers=headers, params=params, json=write_body) as response:
-                    if response.status == 200:
-                        logging.info(f"✅ Archived {len(leaderboard)} ambassadors to '{month_year}' sheet")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Failed to write archive: {error_text}")
-                        return False
-                        
+            async with self._request('PUT', write_url, params=params, json=write_body) as response:
+                if response.status == 200:
+                    logging.info(f"✅ Archived {len(leaderboard)} ambassadors to '{month_year}' sheet")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Failed to write archive: {error_text}")
+                    return False
+                    
         except Exception as e:
             logging.error(f"Error archiving month: {e}")
             return False
@@ -3464,11 +3464,14 @@ class BetaTestingBot(commands.Bot):
                 supabase_client=self.ambassador_program.supabase
             )
             
-            # Full backup to sheets
-            await sheets_manager.full_backup_to_sheets()
-            
-            # Check for manual changes from sheets
-            await sheets_manager.sync_from_sheets_to_supabase()
+            try:
+                # Full backup to sheets
+                await sheets_manager.full_backup_to_sheets()
+                
+                # Check for manual changes from sheets
+                await sheets_manager.sync_from_sheets_to_supabase()
+            finally:
+                await sheets_manager.close()
             
             print("✅ Automated ambassador sheets sync completed")
             
@@ -6836,11 +6839,14 @@ async def archive_month(ctx, month_year: str = None):
             supabase_client=bot.ambassador_program.supabase if hasattr(bot, 'ambassador_program') else None
         )
         
-        if not month_year:
-            month_year = datetime.now().strftime("%b %Y")
-        
-        await ctx.send(f"📦 Archiving leaderboard to '{month_year}' sheet...")
-        success = await sheets_manager.archive_month_leaderboard(month_year)
+        try:
+            if not month_year:
+                month_year = datetime.now().strftime("%b %Y")
+            
+            await ctx.send(f"📦 Archiving leaderboard to '{month_year}' sheet...")
+            success = await sheets_manager.archive_month_leaderboard(month_year)
+        finally:
+            await sheets_manager.close()
         
         if success:
             await ctx.send(f"✅ Successfully archived leaderboard to '{month_year}' sheet!")
@@ -6863,7 +6869,10 @@ async def last_month_leaders(ctx):
             supabase_client=bot.ambassador_program.supabase if hasattr(bot, 'ambassador_program') else None
         )
         
-        leaders = await sheets_manager.get_last_month_leaders(limit=10)
+        try:
+            leaders = await sheets_manager.get_last_month_leaders(limit=10)
+        finally:
+            await sheets_manager.close()
         
         if not leaders:
             # Calculate last month name for message
@@ -8071,21 +8080,24 @@ async def ambassadors_report(ctx, action=None):
                     supabase_client=bot.ambassador_program.supabase
                 )
                 
-                # Full backup - create both sheets and sync all data
-                success = await sheets_manager.full_backup_to_sheets()
-                
-                if success:
-                    await ctx.send("✅ **Complete backup to Google Sheets successful!**")
-                    
-                    # Also sync any manual changes back from sheets
-                    await sheets_manager.sync_from_sheets_to_supabase()
-                    await ctx.send("🔄 Synced any manual changes from sheets back to database")
+                try:
+                    # Full backup - create both sheets and sync all data
+                    success = await sheets_manager.full_backup_to_sheets()
                     
-                    sheet_url = "https://docs.google.com/spreadsheets/d/1zyGJupeR086ytKMQxtqHtP7UwlQ0redE-aze2RH-RdA"
-                    await ctx.send(f"📊 **Ambassador Control Sheet:** {sheet_url}")
-                    await ctx.send("📋 **Using your existing Sidekick Tools Ambassador Program sheet**\n• **Ambassadors** tab - Control ambassador data and points\n• **Submissions** tab - View and manage all submissions")
-                else:
-                    await ctx.send("❌ Failed to backup to Google Sheets. Check credentials and permissions.")
+                    if success:
+                        await ctx.send("✅ **Complete backup to Google Sheets successful!**")
+                        
+                        # Also sync any manual changes back from sheets
+                        await sheets_manager.sync_from_sheets_to_supabase()
+                        await ctx.send("🔄 Synced any manual changes from sheets back to database")
+                        
+                        sheet_url = "https://docs.google.com/spreadsheets/d/1zyGJupeR086ytKMQxtqHtP7UwlQ0redE-aze2RH-RdA"
+                        await ctx.send(f"📊 **Ambassador Control Sheet:** {sheet_url}")
+                        await ctx.send("📋 **Using your existing Sidekick Tools Ambassador Program sheet**\n• **Ambassadors** tab - Control ambassador data and points\n• **Submissions** tab - View and manage all submissions")
+                    else:
+                        await ctx.send("❌ Failed to backup to Google Sheets. Check credentials and permissions.")
+                finally:
+                    await sheets_manager.close()
                 
             except ImportError:
                 await ctx.send("❌ Google Sheets integration not available. Missing dependencies.")
@@ -8407,31 +8419,34 @@ async def process_url_submission(message, ambassador_id, url):
                     supabase_client=bot.ambassador_program.supabase
                 )
                 
-                # Get ambassador username
-                amb_result = bot.ambassador_program.supabase.table('ambassadors').select('username', 'current_month_points', 'total_points').eq('discord_id', ambassador_id).execute()
-                amb_username = amb_result.data[0]['username'] if amb_result.data else 'Unknown'
-                current_pts = amb_result.data[0].get('current_month_points', 0) if amb_result.data else 0
-                total_pts = amb_result.data[0].get('total_points', 0) if amb_result.data else 0
-                
-                # Append submission to sheet
-                submission_data = {
-                    'ambassador_id': ambassador_id,
-                    'platform': platform.value if hasattr(platform, 'value') else str(platform),
-                    'post_type': post_type.value if hasattr(post_type, 'value') else str(post_type),
-                    'url': url,
-                    'points_awarded': points,
-                    'timestamp': datetime.now().isoformat(),
-                    'validity_status': validity_status,
-                    'message_id': str(message.id),
-                    'notes': message.content[:100] if message.content else ''
-                }
-                await sheets_manager.append_submission_va_safe(submission_data, amb_username)
-                
-                # Update ambassador points in sheet
-                submissions_count = len(bot.ambassador_program.supabase.table('submissions').select('id').eq('ambassador_id', ambassador_id).execute().data)
-                await sheets_manager.update_ambassador_points_va_safe(
-                    ambassador_id, amb_username, current_pts + points, total_pts + points, submissions_count
-                )
+                try:
+                    # Get ambassador username
+                    amb_result = bot.ambassador_program.supabase.table('ambassadors').select('username', 'current_month_points', 'total_points').eq('discord_id', ambassador_id).execute()
+                    amb_username = amb_result.data[0]['username'] if amb_result.data else 'Unknown'
+                    current_pts = amb_result.data[0].get('current_month_points', 0) if amb_result.data else 0
+                    total_pts = amb_result.data[0].get('total_points', 0) if amb_result.data else 0
+                    
+                    # Append submission to sheet
+                    submission_data = {
+                        'ambassador_id': ambassador_id,
+                        'platform': platform.value if hasattr(platform, 'value') else str(platform),
+                        'post_type': post_type.value if hasattr(post_type, 'value') else str(post_type),
+                        'url': url,
+                        'points_awarded': points,
+                        'timestamp': datetime.now().isoformat(),
+                        'validity_status': validity_status,
+                        'message_id': str(message.id),
+                        'notes': message.content[:100] if message.content else ''
+                    }
+                    await sheets_manager.append_submission_va_safe(submission_data, amb_username)
+                    
+                    # Update ambassador points in sheet
+                    submissions_count = len(bot.ambassador_program.supabase.table('submissions').select('id').eq('ambassador_id', ambassador_id).execute().data)
+                    await sheets_manager.update_ambassador_points_va_safe(
+                        ambassador_id, amb_username, current_pts + points, total_pts + points, submissions_count
+                    )
+                finally:
+                    await sheets_manager.close()
                 print(f"✅ Synced submission to Google Sheets for {amb_username}")
             except Exception as sheet_error:
                 print(f"⚠️ Failed to sync to Google Sheets: {sheet_error}")
@@ -8643,32 +8658,35 @@ async def process_screenshot_submission(message, ambassador_id, screenshot):
                     supabase_client=bot.ambassador_program.supabase
                 )
                 
-                # Get ambassador username
-                amb_result = bot.ambassador_program.supabase.table('ambassadors').select('username', 'current_month_points', 'total_points').eq('discord_id', ambassador_id).execute()
-                amb_username = amb_result.data[0]['username'] if amb_result.data else 'Unknown'
-                current_pts = amb_result.data[0].get('current_month_points', 0) if amb_result.data else 0
-                total_pts = amb_result.data[0].get('total_points', 0) if amb_result.data else 0
-                
-                # Append submission to sheet
-                submission_data = {
-                    'ambassador_id': ambassador_id,
-                    'platform': platform.value if hasattr(platform, 'value') else str(platform),
-                    'post_type': post_type.value if hasattr(post_type, 'value') else str(post_type),
-                    'url': '',
-                    'points_awarded': points,
-                    'timestamp': datetime.now().isoformat(),
-                    'validity_status': validity_status,
-                    'screenshot_hash': content_hash,
-                    'message_id': str(message.id),
-                    'notes': analysis.get('content_preview', message.content[:100] if message.content else '')
-                }
-                await sheets_manager.append_submission_va_safe(submission_data, amb_username)
-                
-                # Update ambassador points in sheet
-                submissions_count = len(bot.ambassador_program.supabase.table('submissions').select('id').eq('ambassador_id', ambassador_id).execute().data)
-                await sheets_manager.update_ambassador_points_va_safe(
-                    ambassador_id, amb_username, current_pts + points, total_pts + points, submissions_count
-                )
+                try:
+                    # Get ambassador username
+                    amb_result = bot.ambassador_program.supabase.table('ambassadors').select('username', 'current_month_points', 'total_points').eq('discord_id', ambassador_id).execute()
+                    amb_username = amb_result.data[0]['username'] if amb_result.data else 'Unknown'
+                    current_pts = amb_result.data[0].get('current_month_points', 0) if amb_result.data else 0
+                    total_pts = amb_result.data[0].get('total_points', 0) if amb_result.data else 0
+                    
+                    # Append submission to sheet
+                    submission_data = {
+                        'ambassador_id': ambassador_id,
+                        'platform': platform.value if hasattr(platform, 'value') else str(platform),
+                        'post_type': post_type.value if hasattr(post_type, 'value') else str(post_type),
+                        'url': '',
+                        'points_awarded': points,
+                        'timestamp': datetime.now().isoformat(),
+                        'validity_status': validity_status,
+                        'screenshot_hash': content_hash,
+                        'message_id': str(message.id),
+                        'notes': analysis.get('content_preview', message.content[:100] if message.content else '')
+                    }
+                    await sheets_manager.append_submission_va_safe(submission_data, amb_username)
+                    
+                    # Update ambassador points in sheet
+                    submissions_count = len(bot.ambassador_program.supabase.table('submissions').select('id').eq('ambassador_id', ambassador_id).execute().data)
+                    await sheets_manager.update_ambassador_points_va_safe(
+                        ambassador_id, amb_username, current_pts + points, total_pts + points, submissions_count
+                    )
+                finally:
+                    await sheets_manager.close()
                 print(f"✅ Synced screenshot submission to Google Sheets for {amb_username}")
             except Exception as sheet_error:
                 print(f"⚠️ Failed to sync to Google Sheets: {sheet_error}")